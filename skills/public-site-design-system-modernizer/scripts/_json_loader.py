@@ -0,0 +1,34 @@
+"""Shared JSON loading for the modernizer scripts (orjson when installed, else json)."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Callable
+
+
+def _stdlib_loads(data: bytes | memoryview) -> Any:
+    return json.loads(bytes(data))
+
+
+def _orjson_loads(data: bytes | memoryview) -> Any:
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # orjson rejects NaN/Infinity and integers beyond 64 bits, which the
+        # stdlib parser accepts; let json decide so results don't depend on
+        # which optional package is installed.
+        return _stdlib_loads(data)
+
+
+_loads: Callable[[bytes | memoryview], Any] = _stdlib_loads
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json is the fallback
+    pass
+else:
+    _loads = _orjson_loads
+
+
+def load_json(path: str) -> Any:
+    return _loads(Path(path).read_bytes())
@@ -4,25 +4,70 @@
 from __future__ import annotations
 
 import argparse
-import json
+import io
+import itertools
 import math
 import sys
 from pathlib import Path
 from typing import Any
 
+from _json_loader import load_json
 
-def load_json(path: str) -> Any:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
 
+# Fixed sections of the run plan; dynamic lists are written between them.
+_HEADER_TEMPLATE = """\
+# Run Plan Preview: {name}
 
-def workload_class(config: dict[str, Any], url_count: int) -> str:
-    max_pages = int(config.get("scope", {}).get("max_pages", url_count or 0) or 0)
-    screenshots = config.get("capture", {}).get("screenshots", {})
-    screenshot_modes = sum(1 for v in screenshots.values() if v)
+## Project Intent
+- Mode: `{mode}`
+- Source URL: `{source_url}`
+- Audience: `{audience}`
+- Intended use: `{intended_use}`
+- Warning: Outputs are brand-faithful, normalized, and non-clone by design.
+
+## Crawl Scope
+- Crawl mode: `{crawl_mode}`
+- Max pages: `{max_pages}`
+- Max depth: `{max_depth}`
+- Include subdomains: `{include_subdomains}`
+- Respect robots.txt: `{respect_robots_txt}`
+- Crawl delay (ms): `{crawl_delay_ms}`
+- Requests/sec: `{requests_per_second}`
+
+## Included / Excluded Paths
+"""
+
+_SETTINGS_TEMPLATE = """
+## Capture Settings
+- Screenshots: desktop={desktop}, mobile={mobile}, tablet={tablet}
+- HTML capture: `{html}`
+- CSS capture: `{css}`
+- Text capture: `{text}`
+- Asset metadata: `{asset_metadata}`
+- Component candidates: `{component_candidates}`
+
+## Quality Controls
+- Canonical token confidence threshold: `{threshold}`
+- Low-confidence fallback: `{fallback}`
+- Contrast checks: `{contrast_checks}`
+- Anti-pattern report: `{anti_pattern_report}`
+- PNIE matrix: `{pnie_matrix}`
+
+## Output Artifacts
+"""
+
+_FOOTER_TEMPLATE = """
+## Estimated Workload
+- Class: `{workload}`
+
+_Do not begin crawling until this run plan is reviewed._
+"""
+
+
+def workload_class(max_pages: int, screenshot_modes: int, crawl_mode: str, url_count: int) -> str:
     score = max(max_pages, url_count)
     score += 5 if screenshot_modes >= 2 else 0
-    score += 5 if config.get("scope", {}).get("crawl_mode") == "bounded_full" else 0
+    score += 5 if crawl_mode == "bounded_full" else 0
     if score <= 15:
         return "fast"
     if score <= 50:
@@ -30,39 +75,54 @@ def workload_class(config: dict[str, Any], url_count: int) -> str:
     return "heavy"
 
 
-def normalize_urls(url_data: Any) -> list[str]:
+def normalize_urls(url_data: Any, limit: int | None = None) -> tuple[list[str], int]:
+    """Return up to `limit` URLs plus the total number of URLs in the input."""
     if url_data is None:
-        return []
+        return [], 0
     if isinstance(url_data, list):
-        return [str(u) for u in url_data]
+        return [str(u) for u in url_data[:limit]], len(url_data)
     if isinstance(url_data, dict):
         if isinstance(url_data.get("urls"), list):
-            return [str(u) for u in url_data["urls"]]
+            return [str(u) for u in url_data["urls"][:limit]], len(url_data["urls"])
         if isinstance(url_data.get("pages"), list):
-            return [str(p.get("url")) for p in url_data["pages"] if isinstance(p, dict) and p.get("url")]
+            pages = (p["url"] for p in url_data["pages"] if isinstance(p, dict) and p.get("url"))
+            urls = [str(u) for u in itertools.islice(pages, limit)]
+            return urls, len(urls) + sum(1 for _ in pages)
     raise ValueError("URL input must be a list or an object with 'urls' or 'pages'")
 
 
-def render(config: dict[str, Any], urls: list[str]) -> str:
+def render(config: dict[str, Any], urls: list[str], total_urls: int | None = None) -> str:
     project = config.get("project", {})
     scope = config.get("scope", {})
     capture = config.get("capture", {})
     quality = config.get("quality", {})
     output = config.get("output", {})
+    screenshots = capture.get("screenshots") or {}
+    max_pages_raw = scope.get("max_pages")
+    crawl_mode = scope.get("crawl_mode", "representative_sample")
+    robots_on = bool(scope.get("respect_robots_txt", True))
+    css_on = bool(capture.get("css", True))
+    text_on = bool(capture.get("text", True))
+    desktop_on = bool(screenshots.get("desktop", False))
+    mobile_on = bool(screenshots.get("mobile", False))
+    tablet_on = bool(screenshots.get("tablet", False))
+    screenshot_modes = sum(1 for v in screenshots.values() if v)
     warnings = []
 
-    if not scope.get("respect_robots_txt", True):
+    if not robots_on:
         warnings.append("robots.txt respect is disabled; confirm policy allows this.")
-    if not capture.get("css", True):
+    if not css_on:
         warnings.append("CSS capture disabled; visual token confidence may degrade.")
-    if not capture.get("text", True):
+    if not text_on:
         warnings.append("Text capture disabled; voice DNA extraction may degrade.")
-    if not capture.get("screenshots", {}).get("desktop", False):
+    if not desktop_on:
         warnings.append("Desktop screenshots disabled; this violates the recommended/default profile.")
     if len(urls) == 0:
         warnings.append("No URLs selected yet; crawl plan is incomplete.")
 
-    selected_urls = urls[: int(scope.get("max_pages", len(urls) or 0) or len(urls))]
+    selected_urls = urls[: int(max_pages_raw or len(urls))]
+    if total_urls is None:
+        total_urls = len(urls)
     excluded = scope.get("exclude_paths", [])
     outputs = output.get("artifacts") or [
         "reports/*",
@@ -74,77 +134,68 @@ def render(config: dict[str, Any], urls: list[str]) -> str:
         "evidence/*",
     ]
 
-    lines: list[str] = []
-    lines.append(f"# Run Plan Preview: {project.get('name', 'Untitled Project')}")
-    lines.append("")
-    lines.append("## Project Intent")
-    lines.append(f"- Mode: `{config.get('mode', 'brand_faithful_modernization')}`")
-    lines.append(f"- Source URL: `{project.get('source_url', '')}`")
-    lines.append(f"- Audience: `{project.get('output_audience', 'both')}`")
-    lines.append(f"- Intended use: `{project.get('intended_use', 'rebuild_baseline')}`")
-    lines.append("- Warning: Outputs are brand-faithful, normalized, and non-clone by design.")
-    lines.append("")
-    lines.append("## Crawl Scope")
-    lines.append(f"- Crawl mode: `{scope.get('crawl_mode', 'representative_sample')}`")
-    lines.append(f"- Max pages: `{scope.get('max_pages', 'n/a')}`")
-    lines.append(f"- Max depth: `{scope.get('max_depth', 'n/a')}`")
-    lines.append(f"- Include subdomains: `{bool(scope.get('include_subdomains', False))}`")
-    lines.append(f"- Respect robots.txt: `{bool(scope.get('respect_robots_txt', True))}`")
-    lines.append(f"- Crawl delay (ms): `{scope.get('crawl_delay_ms', 'n/a')}`")
-    lines.append(f"- Requests/sec: `{scope.get('requests_per_second', 'n/a')}`")
-    lines.append("")
-    lines.append("## Included / Excluded Paths")
+    ctx = {
+        "name": project.get("name", "Untitled Project"),
+        "mode": config.get("mode", "brand_faithful_modernization"),
+        "source_url": project.get("source_url", ""),
+        "audience": project.get("output_audience", "both"),
+        "intended_use": project.get("intended_use", "rebuild_baseline"),
+        "crawl_mode": crawl_mode,
+        "max_pages": scope.get("max_pages", "n/a"),
+        "max_depth": scope.get("max_depth", "n/a"),
+        "include_subdomains": bool(scope.get("include_subdomains", False)),
+        "respect_robots_txt": robots_on,
+        "crawl_delay_ms": scope.get("crawl_delay_ms", "n/a"),
+        "requests_per_second": scope.get("requests_per_second", "n/a"),
+        "desktop": desktop_on,
+        "mobile": mobile_on,
+        "tablet": tablet_on,
+        "html": bool(capture.get("html", True)),
+        "css": css_on,
+        "text": text_on,
+        "asset_metadata": bool(capture.get("asset_metadata", True)),
+        "component_candidates": bool(capture.get("component_candidates", True)),
+        "threshold": quality.get("canonical_token_confidence_threshold", 0.7),
+        "fallback": quality.get("low_confidence_fallback", "suggest_candidates"),
+        "contrast_checks": bool(quality.get("require_contrast_checks", True)),
+        "anti_pattern_report": bool(quality.get("require_anti_pattern_report", True)),
+        "pnie_matrix": bool(quality.get("require_pnie_matrix", True)),
+        "workload": workload_class(
+            int(max_pages_raw or 0), screenshot_modes, crawl_mode, len(selected_urls)
+        ),
+    }
+
+    buf = io.StringIO()
+    write = buf.write
+    write(_HEADER_TEMPLATE.format_map(ctx))
     if excluded:
         for item in excluded:
-            lines.append(f"- Exclude: `{item}`")
+            write(f"- Exclude: `{item}`\n")
     else:
-        lines.append("- No explicit excluded paths configured")
-    lines.append("")
-    lines.append("## Selected URLs")
+        write("- No explicit excluded paths configured\n")
+    write("\n## Selected URLs\n")
     if selected_urls:
         for i, url in enumerate(selected_urls, start=1):
-            lines.append(f"{i}. `{url}`")
-        if len(urls) > len(selected_urls):
-            lines.append(f"- Truncated to `max_pages`; {len(urls) - len(selected_urls)} additional URLs not shown")
+            write(f"{i}. `{url}`\n")
+        if total_urls > len(selected_urls):
+            write(f"- Truncated to `max_pages`; {total_urls - len(selected_urls)} additional URLs not shown\n")
     else:
-        lines.append("- No URLs selected")
-    lines.append("")
-    lines.append("## Capture Settings")
-    screenshots = capture.get("screenshots", {})
-    lines.append(f"- Screenshots: desktop={bool(screenshots.get('desktop', False))}, mobile={bool(screenshots.get('mobile', False))}, tablet={bool(screenshots.get('tablet', False))}")
-    lines.append(f"- HTML capture: `{bool(capture.get('html', True))}`")
-    lines.append(f"- CSS capture: `{bool(capture.get('css', True))}`")
-    lines.append(f"- Text capture: `{bool(capture.get('text', True))}`")
-    lines.append(f"- Asset metadata: `{bool(capture.get('asset_metadata', True))}`")
-    lines.append(f"- Component candidates: `{bool(capture.get('component_candidates', True))}`")
-    lines.append("")
-    lines.append("## Quality Controls")
-    lines.append(f"- Canonical token confidence threshold: `{quality.get('canonical_token_confidence_threshold', 0.7)}`")
-    lines.append(f"- Low-confidence fallback: `{quality.get('low_confidence_fallback', 'suggest_candidates')}`")
-    lines.append(f"- Contrast checks: `{bool(quality.get('require_contrast_checks', True))}`")
-    lines.append(f"- Anti-pattern report: `{bool(quality.get('require_anti_pattern_report', True))}`")
-    lines.append(f"- PNIE matrix: `{bool(quality.get('require_pnie_matrix', True))}`")
-    lines.append("")
-    lines.append("## Output Artifacts")
+        write("- No URLs selected\n")
+    write(_SETTINGS_TEMPLATE.format_map(ctx))
     for artifact in outputs:
-        lines.append(f"- `{artifact}`")
-    lines.append("")
-    lines.append("## Warnings")
+        write(f"- `{artifact}`\n")
+    write("\n## Warnings\n")
     if warnings:
         for warning in warnings:
-            lines.append(f"- {warning}")
+            write(f"- {warning}\n")
     else:
-        lines.append("- None detected from configuration")
-    lines.append("")
-    lines.append("## Estimated Workload")
-    lines.append(f"- Class: `{workload_class(config, len(selected_urls))}`")
-    lines.append("")
-    lines.append("_Do not begin crawling until this run plan is reviewed._")
-    return "\n".join(lines) + "\n"
+        write("- None detected from configuration\n")
+    write(_FOOTER_TEMPLATE.format_map(ctx))
+    return buf.getvalue()
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser(description=__doc__)
+    parser = argparse.ArgumentParser(description=globals().get("__doc__"))
     parser.add_argument("config_json", help="Path to normalized config JSON")
     parser.add_argument(
         "--urls-json",
@@ -157,13 +208,21 @@ def main() -> int:
     args = parser.parse_args()
 
     config = load_json(args.config_json)
-    urls = normalize_urls(load_json(args.urls_json)) if args.urls_json else []
-    markdown = render(config, urls)
+    max_pages = int(config.get("scope", {}).get("max_pages") or 0)
+    limit = max_pages if max_pages > 0 else None
+    if args.urls_json:
+        urls, total_urls = normalize_urls(load_json(args.urls_json), limit)
+    else:
+        urls, total_urls = [], 0
+    markdown = render(config, urls, total_urls)
 
+    data = markdown.encode("utf-8")
     if args.output:
-        Path(args.output).write_text(markdown, encoding="utf-8")
+        Path(args.output).write_bytes(data)
     else:
-        sys.stdout.write(markdown)
+        sys.stdout.flush()
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
     return 0
 
 
@@ -0,0 +1,33 @@
+"""Optional mypyc build for the bundled scripts.
+
+The scripts run unchanged as plain Python. To compile them into C extension
+modules next to the .py files (requires `pip install mypy setuptools`):
+
+    python setup.py build_ext --inplace
+
+Running a script by path (`python render_run_plan.py ...`) always executes the
+.py source. To use the compiled module, import it instead, e.g.:
+
+    python -c "import sys, render_run_plan; sys.exit(render_run_plan.main())" ...
+
+_json_loader.py is left uncompiled on purpose: the scripts import it, so an
+in-place build would silently shadow later edits to the .py file. Compiled
+modules leave `__doc__` unset, which is why the scripts pass
+`globals().get("__doc__")` to argparse. Delete the generated .so/.pyd files to
+return to the pure-Python path.
+"""
+
+from mypyc.build import mypycify
+from setuptools import setup
+
+setup(
+    name="public-site-design-system-modernizer-scripts",
+    py_modules=[],
+    ext_modules=mypycify(
+        [
+            "render_run_plan.py",
+            "validate_intake_config.py",
+            "validate_output_package.py",
+        ]
+    ),
+)
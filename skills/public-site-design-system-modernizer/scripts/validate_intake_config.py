@@ -4,25 +4,48 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sys
-from typing import Any
-
-
-ALLOWED_AUDIENCES = {"designer", "developer", "both"}
-ALLOWED_INTENDED_USE = {"internal_exploration", "client_work", "rebuild_baseline"}
-ALLOWED_CRAWL_MODES = {"representative_sample", "bounded_full", "custom_urls", "sitemap"}
-ALLOWED_FALLBACKS = {"suggest_candidates", "mark_unknown", "infer_ranges"}
-DEFAULT_EXCLUDE_HINTS = {"/legal", "/privacy", "/terms", "/careers", "/login"}
-
-
-def load_json(path: str) -> Any:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-
-def is_http_url(value: Any) -> bool:
-    return isinstance(value, str) and (value.startswith("http://") or value.startswith("https://"))
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from typing import TypeGuard
+
+from _json_loader import load_json
+
+
+ALLOWED_AUDIENCES = frozenset({"designer", "developer", "both"})
+ALLOWED_INTENDED_USE = frozenset({"internal_exploration", "client_work", "rebuild_baseline"})
+ALLOWED_CRAWL_MODES = frozenset({"representative_sample", "bounded_full", "custom_urls", "sitemap"})
+ALLOWED_FALLBACKS = frozenset({"suggest_candidates", "mark_unknown", "infer_ranges"})
+DEFAULT_EXCLUDE_HINTS = frozenset({"/legal", "/privacy", "/terms", "/careers", "/login"})
+_HTTP_PREFIXES = ("http://", "https://")
+
+# Required typed fields per section, checked in order: (key, kind, minimum).
+_SCOPE_SCHEMA = (
+    ("max_pages", int, 1),
+    ("max_depth", int, 0),
+    ("include_subdomains", bool, None),
+    ("respect_robots_txt", bool, None),
+    ("crawl_delay_ms", int, 0),
+    ("requests_per_second", float, 0.1),
+)
+_CAPTURE_SCHEMA = (
+    ("html", bool, None),
+    ("css", bool, None),
+    ("text", bool, None),
+    ("asset_metadata", bool, None),
+    ("component_candidates", bool, None),
+)
+_QUALITY_SCHEMA = (("canonical_token_confidence_threshold", float, 0.0),)
+_QUALITY_FLAGS_SCHEMA = (
+    ("require_contrast_checks", bool, None),
+    ("require_anti_pattern_report", bool, None),
+    ("require_pnie_matrix", bool, None),
+)
+
+
+def is_http_url(value: Any) -> TypeGuard[str]:
+    return type(value) is str and value.startswith(_HTTP_PREFIXES)
 
 
 def add_error(errors: list[str], path: str, message: str) -> None:
@@ -33,34 +56,32 @@ def add_warn(warnings: list[str], path: str, message: str) -> None:
     warnings.append(f"{path}: {message}")
 
 
-def expect_bool(obj: dict[str, Any], key: str, path: str, errors: list[str]) -> None:
-    if key not in obj:
-        add_error(errors, f"{path}.{key}", "missing required boolean")
-        return
-    if not isinstance(obj[key], bool):
-        add_error(errors, f"{path}.{key}", "must be boolean")
-
-
-def expect_number(
+def _check_schema(
     obj: dict[str, Any],
-    key: str,
+    schema: tuple[tuple[str, type, int | float | None], ...],
     path: str,
     errors: list[str],
-    minimum: float | None = None,
-    integer: bool = False,
 ) -> None:
-    if key not in obj:
-        add_error(errors, f"{path}.{key}", "missing required number")
-        return
-    value = obj[key]
-    ok_type = isinstance(value, int) and not isinstance(value, bool)
-    if not integer:
-        ok_type = ok_type or isinstance(value, float)
-    if not ok_type:
-        add_error(errors, f"{path}.{key}", "must be a number")
-        return
-    if minimum is not None and value < minimum:
-        add_error(errors, f"{path}.{key}", f"must be >= {minimum}")
+    """Check required fields against a (key, kind, minimum) table.
+
+    `kind` is `bool`, `int`, or `float` (any non-boolean number); `minimum` is
+    ignored for booleans.
+    """
+    error = add_error
+    for key, kind, minimum in schema:
+        if key not in obj:
+            error(errors, f"{path}.{key}", f"missing required {'boolean' if kind is bool else 'number'}")
+            continue
+        value = obj[key]
+        if kind is bool:
+            if value is not True and value is not False:
+                error(errors, f"{path}.{key}", "must be boolean")
+            continue
+        if value is True or value is False or not isinstance(value, (int, float) if kind is float else int):
+            error(errors, f"{path}.{key}", "must be a number")
+            continue
+        if minimum is not None and value < minimum:
+            error(errors, f"{path}.{key}", f"must be >= {minimum}")
 
 
 def validate_project(cfg: dict[str, Any], errors: list[str], warnings: list[str]) -> None:
@@ -95,18 +116,13 @@ def validate_scope(cfg: dict[str, Any], errors: list[str], warnings: list[str])
     if crawl_mode not in ALLOWED_CRAWL_MODES:
         add_error(errors, "scope.crawl_mode", f"must be one of {sorted(ALLOWED_CRAWL_MODES)}")
 
-    expect_number(scope, "max_pages", "scope", errors, minimum=1, integer=True)
-    expect_number(scope, "max_depth", "scope", errors, minimum=0, integer=True)
-    expect_bool(scope, "include_subdomains", "scope", errors)
-    expect_bool(scope, "respect_robots_txt", "scope", errors)
-    expect_number(scope, "crawl_delay_ms", "scope", errors, minimum=0, integer=True)
-    expect_number(scope, "requests_per_second", "scope", errors, minimum=0.1, integer=False)
+    _check_schema(scope, _SCOPE_SCHEMA, "scope", errors)
 
     exclude_paths = scope.get("exclude_paths")
     if not isinstance(exclude_paths, list) or not all(isinstance(x, str) for x in exclude_paths):
         add_error(errors, "scope.exclude_paths", "must be a list of strings")
     else:
-        if not DEFAULT_EXCLUDE_HINTS.intersection(set(exclude_paths)):
+        if not DEFAULT_EXCLUDE_HINTS.intersection(exclude_paths):
             add_warn(
                 warnings,
                 "scope.exclude_paths",
@@ -117,7 +133,7 @@ def validate_scope(cfg: dict[str, Any], errors: list[str], warnings: list[str])
         urls = scope.get("custom_urls")
         if not isinstance(urls, list) or not urls:
             add_error(errors, "scope.custom_urls", "required non-empty list when crawl_mode=custom_urls")
-        elif not all(is_http_url(u) for u in urls):
+        elif not all(type(u) is str and u.startswith(_HTTP_PREFIXES) for u in urls):
             add_error(errors, "scope.custom_urls", "all entries must be http(s) URLs")
     elif "custom_urls" in scope and scope.get("custom_urls"):
         add_warn(warnings, "scope.custom_urls", "ignored unless crawl_mode=custom_urls")
@@ -148,8 +164,7 @@ def validate_capture(cfg: dict[str, Any], errors: list[str], warnings: list[str]
         if screenshots.get("mobile") is not True:
             add_warn(warnings, "capture.screenshots.mobile", "recommended true for better visual hierarchy coverage")
 
-    for key in ("html", "css", "text", "asset_metadata", "component_candidates"):
-        expect_bool(capture, key, "capture", errors)
+    _check_schema(capture, _CAPTURE_SCHEMA, "capture", errors)
     if "computed_css_samples" in capture and not isinstance(capture["computed_css_samples"], bool):
         add_error(errors, "capture.computed_css_samples", "must be boolean if provided")
 
@@ -165,14 +180,7 @@ def validate_quality(cfg: dict[str, Any], errors: list[str], warnings: list[str]
         add_error(errors, "quality", "missing required object")
         return
 
-    expect_number(
-        quality,
-        "canonical_token_confidence_threshold",
-        "quality",
-        errors,
-        minimum=0.0,
-        integer=False,
-    )
+    _check_schema(quality, _QUALITY_SCHEMA, "quality", errors)
     threshold = quality.get("canonical_token_confidence_threshold")
     if isinstance(threshold, (int, float)) and not isinstance(threshold, bool):
         if threshold > 1:
@@ -184,8 +192,7 @@ def validate_quality(cfg: dict[str, Any], errors: list[str], warnings: list[str]
     if fallback not in ALLOWED_FALLBACKS:
         add_error(errors, "quality.low_confidence_fallback", f"must be one of {sorted(ALLOWED_FALLBACKS)}")
 
-    for key in ("require_contrast_checks", "require_anti_pattern_report", "require_pnie_matrix"):
-        expect_bool(quality, key, "quality", errors)
+    _check_schema(quality, _QUALITY_FLAGS_SCHEMA, "quality", errors)
 
 
 def validate_guardrails(cfg: dict[str, Any], errors: list[str]) -> None:
@@ -219,7 +226,7 @@ def validate_output(cfg: dict[str, Any], warnings: list[str]) -> None:
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser(description=__doc__)
+    parser = argparse.ArgumentParser(description=globals().get("__doc__"))
     parser.add_argument("config_json", help="Path to normalized config JSON")
     parser.add_argument(
         "--strict-guardrails",
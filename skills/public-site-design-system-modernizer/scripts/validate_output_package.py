@@ -4,12 +4,22 @@
 from __future__ import annotations
 
 import argparse
-import json
+import mmap
+import os
+import re
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
+from _json_loader import _loads
 
-REQUIRED_PATHS = [
+try:
+    import ijson  # type: ignore  # picks the fastest installed backend (yajl2_c first)
+except ImportError:  # ijson is optional; fall back to a full parse
+    ijson = None
+
+
+REQUIRED_PATHS = (
     "reports/executive-summary.md",
     "reports/source-audit.md",
     "reports/brand-dna.md",
@@ -24,24 +34,105 @@ REQUIRED_PATHS = [
     "evidence/crawl-manifest.json",
     "evidence/page-weights.json",
     "evidence/extraction-confidence.json",
-]
+)
+
+PNIE_TERMS = ("Preserve", "Normalize", "Improve", "Exclude")
+_PNIE_RE = re.compile("|".join(PNIE_TERMS).encode())
+_NONDERIV_RE = re.compile(rb"not a clone|brand-faithful|normalize|must not be copied", re.IGNORECASE)
+
+# Files above this size are memory-mapped instead of copied into a bytes object.
+MMAP_THRESHOLD = 16 * 1024 * 1024
+
+
+def _existing_relpaths(root: Path) -> set[str]:
+    """Return the REQUIRED_PATHS entries that are files, scanning each parent dir once."""
+    found: set[str] = set()
+    for parent in {rel.rpartition("/")[0] for rel in REQUIRED_PATHS}:
+        try:
+            it = os.scandir(root / parent)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_file():
+                    found.add(f"{parent}/{entry.name}")
+    return found
+
+
+def _load_file(path: Path) -> Any:
+    if path.stat().st_size <= MMAP_THRESHOLD:
+        return _loads(path.read_bytes())
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        try:
+            with memoryview(mm) as view:
+                return _loads(view)
+        finally:
+            mm.close()
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def _open_report(path: Path) -> Iterator[bytes | mmap.mmap]:
+    """Yield a report's raw bytes for regex scanning, memory-mapping large files."""
+    if path.stat().st_size <= MMAP_THRESHOLD:
+        yield path.read_bytes()
+        return
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        yield mm
 
 
 def parse_json(path: Path) -> tuple[Any | None, str | None]:
     try:
-        return json.loads(path.read_text(encoding="utf-8")), None
+        return _load_file(path), None
     except Exception as exc:  # noqa: BLE001
         return None, str(exc)
 
 
-def require_keys(obj: dict[str, Any], keys: list[str], path: str, errors: list[str]) -> None:
-    missing = [k for k in keys if k not in obj]
+def _top_level_keys(path: Path, keys: set[str]) -> set[str]:
+    """Return which of `keys` appear in the top-level object of a JSON file.
+
+    Streams the file with ijson and stops as soon as every key has been seen,
+    so large evidence files are never fully loaded. Raises TypeError if the
+    document is not an object.
+    """
+    if ijson is None:
+        data = _load_file(path)
+        if not isinstance(data, dict):
+            raise TypeError("expected top-level object")
+        return keys.intersection(data)
+
+    seen: set[str] = set()
+    depth = 0
+    with path.open("rb") as f:
+        for event, value in ijson.basic_parse(f):
+            if event == "start_map" or event == "start_array":
+                if depth == 0 and event == "start_array":
+                    raise TypeError("expected top-level object")
+                depth += 1
+            elif event == "end_map" or event == "end_array":
+                depth -= 1
+                if depth == 0:
+                    break
+            elif depth == 0:
+                raise TypeError("expected top-level object")
+            elif depth == 1 and event == "map_key" and value in keys:
+                seen.add(value)
+                if seen == keys:
+                    break
+    return seen
+
+
+def require_keys(found: set[str], keys: list[str], path: str, errors: list[str]) -> None:
+    missing = [k for k in keys if k not in found]
     if missing:
         errors.append(f"{path}: missing keys {missing}")
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser(description=__doc__)
+    parser = argparse.ArgumentParser(description=globals().get("__doc__"))
     parser.add_argument(
         "output_dir",
         nargs="?",
@@ -54,10 +145,10 @@ def main() -> int:
     errors: list[str] = []
     warnings: list[str] = []
 
+    present = _existing_relpaths(root)
     for rel in REQUIRED_PATHS:
-        p = root / rel
-        if not p.exists():
-            errors.append(f"Missing required file: {p}")
+        if rel not in present:
+            errors.append(f"Missing required file: {root / rel}")
 
     if errors:
         for msg in errors:
@@ -78,43 +169,32 @@ def main() -> int:
     else:
         errors.append(f"{tokens_json}: expected top-level object")
 
-    manifest_json = root / "evidence/crawl-manifest.json"
-    data, err = parse_json(manifest_json)
-    if err:
-        errors.append(f"{manifest_json}: invalid JSON ({err})")
-    elif isinstance(data, dict):
-        require_keys(data, ["source_url", "crawl_mode", "pages"], str(manifest_json), errors)
-    else:
-        errors.append(f"{manifest_json}: expected top-level object")
-
-    page_weights_json = root / "evidence/page-weights.json"
-    data, err = parse_json(page_weights_json)
-    if err:
-        errors.append(f"{page_weights_json}: invalid JSON ({err})")
-    elif isinstance(data, dict):
-        require_keys(data, ["clusters", "pages"], str(page_weights_json), errors)
-    else:
-        errors.append(f"{page_weights_json}: expected top-level object")
-
-    confidence_json = root / "evidence/extraction-confidence.json"
-    data, err = parse_json(confidence_json)
-    if err:
-        errors.append(f"{confidence_json}: invalid JSON ({err})")
-    elif isinstance(data, dict):
-        require_keys(data, ["threshold"], str(confidence_json), errors)
-    else:
-        errors.append(f"{confidence_json}: expected top-level object")
+    keyed_files = [
+        ("evidence/crawl-manifest.json", ["source_url", "crawl_mode", "pages"]),
+        ("evidence/page-weights.json", ["clusters", "pages"]),
+        ("evidence/extraction-confidence.json", ["threshold"]),
+    ]
+    for rel, keys in keyed_files:
+        path = root / rel
+        try:
+            found = _top_level_keys(path, set(keys))
+        except TypeError:
+            errors.append(f"{path}: expected top-level object")
+        except Exception as exc:  # noqa: BLE001
+            errors.append(f"{path}: invalid JSON ({' '.join(str(exc).split())})")
+        else:
+            require_keys(found, keys, str(path), errors)
 
     # Report content checks
-    pnie = (root / "reports/preserve-normalize-improve-exclude.md").read_text(encoding="utf-8")
-    expected_terms = ["Preserve", "Normalize", "Improve", "Exclude"]
-    for term in expected_terms:
-        if term not in pnie:
+    with _open_report(root / "reports/preserve-normalize-improve-exclude.md") as pnie:
+        found_terms = set(_PNIE_RE.findall(pnie))
+    for term in PNIE_TERMS:
+        if term.encode() not in found_terms:
             warnings.append(f"PNIE report does not mention '{term}'")
 
-    summary = (root / "reports/executive-summary.md").read_text(encoding="utf-8")
-    non_derivative_markers = ["not a clone", "brand-faithful", "normalize", "must not be copied"]
-    if not any(marker in summary.lower() for marker in [m.lower() for m in non_derivative_markers]):
+    with _open_report(root / "reports/executive-summary.md") as summary:
+        has_guardrail = _NONDERIV_RE.search(summary) is not None
+    if not has_guardrail:
         warnings.append("Executive summary may be missing explicit non-derivative guardrail language")
 
     if errors: